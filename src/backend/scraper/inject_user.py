@@ -1,9 +1,7 @@
 import asyncio
 import json
-import nats
 import sqlite3
 import re
-from nats.aio.client import Client as NATS
 
 def init_db():
     conn = sqlite3.connect('../../database/sniper.db')
@@ -14,6 +12,27 @@ def init_db():
     conn.commit()
     conn.close()
 
+def init_detections_db(db_path='../../database/sniper.db'):
+    conn = sqlite3.connect(db_path)
+    c = conn.cursor()
+    print('Creating detections table...')
+    c.execute('''CREATE TABLE IF NOT EXISTS detections
+                 (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                  tweet_id TEXT,
+                  username TEXT NOT NULL,
+                  address TEXT NOT NULL,
+                  tweet_time REAL,
+                  detected_at REAL NOT NULL,
+                  broadcast_at REAL,
+                  broadcast_result TEXT,
+                  account TEXT)''')
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_detections_user_time
+                 ON detections (username, detected_at)''')
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_detections_time
+                 ON detections (detected_at)''')
+    conn.commit()
+    conn.close()
+
 # create encrypted wallet sqlite db
 def init_wallet_db():
     conn = sqlite3.connect('../../database/sniper.db')
@@ -144,6 +163,7 @@ class UserMonitor:
     async def run(self):
         print("🚀 Starting user monitor...")
         
+        from nats.aio.client import Client as NATS
         nc = NATS()
         await nc.connect("nats://127.0.0.1:4222")
         print("✅ Connected to NATS")
@@ -166,6 +186,7 @@ def main():
     monitor = UserMonitor()
     loop = asyncio.get_event_loop()
     init_db()
+    init_detections_db()
     init_wallet_db()
     try:
         loop.run_until_complete(monitor.run())
@@ -14,8 +14,8 @@ Key Features:
 
 Dependencies:
     - selenium: For browser automation
-    - webdriver_manager: For ChromeDriver management
     - python-dotenv: For environment variable management
+    - psutil: For the memory watchdog (optional)
     - time, random: For timing and randomization
     - re: For regex pattern matching
     - json: For data storage
@@ -24,29 +24,114 @@ Dependencies:
 """
 import time
 import threading
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 import os
+import sys
+import platform
+import shutil
 from dotenv import load_dotenv
 import re
 import random
-import requests
 import asyncio
-import nats
 import traceback
-import tracemalloc
+import signal
 import sqlite3
+import queue
+import marshal
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
 
-tracemalloc.start()
+from inject_user import init_detections_db
+
+try:
+    import psutil
+except ImportError:  # psutil is only needed for the memory watchdog
+    psutil = None
+
+# Selenium is imported on first use by load_selenium(); tooling that only needs the
+# database helpers never pays for it
+webdriver = By = Keys = WebDriverWait = Options = Service = EC = None
+StaleElementReferenceException = TimeoutException = None
+
+MODULE_LOADED_AT = time.time()
+
+DB_PATH = "../../database/sniper.db"
+
+# Local drivers live in drivers/<platform>/chromedriver; CHROMEDRIVER_PATH overrides
+DRIVERS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "drivers")
+DRIVER_PLATFORMS = {
+    ('darwin', 'arm64'): 'mac-arm64',
+    ('darwin', 'x86_64'): 'mac-x64',
+    ('linux', 'x86_64'): 'linux64',
+    ('linux', 'amd64'): 'linux64',
+    ('win32', 'amd64'): 'win64',
+    ('win32', 'x86'): 'win32',
+}
+
+# Stop monitoring after the first check_user_tweets call, for measuring cold start
+STARTUP_BENCHMARK = os.getenv('MONITOR_STARTUP_BENCHMARK', '') == '1'
+
+NATS_URL = os.getenv('NATS_URL', "nats://127.0.0.1:4222")
+NATS_TOKEN = os.getenv('NATS_TOKEN', "QAkF884gXdP9dXk")
+
+# Profilers are opt-in, e.g. MONITOR_PROFILERS=tracemalloc,cprofile
+MONITOR_PROFILERS = {name.strip().lower() for name in os.getenv('MONITOR_PROFILERS', '').split(',') if name.strip()}
+PROFILE_DIR = os.getenv('MONITOR_PROFILE_DIR', 'profiles')
+PROFILE_SNAPSHOT_SUBJECT = "monitor.profile.snapshot"
+
+# Every new tweet is published to tweets.<username>; set MONITOR_TWEET_STREAM to keep
+# them in a JetStream stream for replay
+TWEET_SUBJECT_PREFIX = "tweets"
+TWEET_STREAM = os.getenv('MONITOR_TWEET_STREAM', '')
+TWEET_STREAM_MAX_AGE = float(os.getenv('MONITOR_TWEET_STREAM_MAX_AGE_SECONDS', str(7 * 24 * 3600)))
+# Tweets republished after a restart within this window are dropped by JetStream
+TWEET_STREAM_DUPLICATE_WINDOW = min(TWEET_STREAM_MAX_AGE, float(os.getenv('MONITOR_TWEET_STREAM_DUPLICATE_WINDOW_SECONDS', str(24 * 3600))))
+
+# Overlays closed after each page load, checked in order in one injected script.
+# Override with MONITOR_OVERLAY_SELECTORS='["selector", ...]'
+OVERLAY_SELECTORS = json.loads(os.getenv('MONITOR_OVERLAY_SELECTORS', 'null')) or [
+    '[data-testid="close"]',  # Generic close button
+    '[data-testid="confirmationSheetClose"]',  # Confirmation sheet close
+    '[data-testid="LoginModal_Close_Button"]',  # Login modal close
+    'div[aria-label="Close"]'  # Generic close by aria-label
+]
+
+DISMISS_OVERLAYS_SCRIPT = """
+const closed = [];
+const clicked = new Set();  // Several selectors often match the same button
+for (const selector of arguments[0]) {
+    const button = Array.from(document.querySelectorAll(selector))
+        .find(el => el.offsetParent !== null && !clicked.has(el));
+    if (button) {
+        button.click();
+        clicked.add(button);
+        closed.push(selector);
+    }
+}
+return closed;
+"""
+
+# Every driver operation must finish within its deadline or the browser is killed
+DRIVER_DEADLINE = float(os.getenv('MONITOR_DRIVER_DEADLINE_SECONDS', '30'))
+# Selenium's own page-load timeout, kept well inside the deadline; a timed out load
+# is treated the same as a hang
+PAGE_LOAD_TIMEOUT = DRIVER_DEADLINE / 2
+LOGIN_DEADLINE = float(os.getenv('MONITOR_LOGIN_DEADLINE_SECONDS', '120'))
+SETUP_DEADLINE = float(os.getenv('MONITOR_SETUP_DEADLINE_SECONDS', '60'))
+# After this many hung logins in a row, each further hang puts the account in cooldown
+LOGIN_HANG_LIMIT = int(os.getenv('MONITOR_LOGIN_HANG_LIMIT', '3'))
+
+# Detections are written to sniper.db in batches from a background thread
+DETECTION_BATCH_SIZE = int(os.getenv('MONITOR_DETECTION_BATCH_SIZE', '50'))
+DETECTION_FLUSH_INTERVAL = float(os.getenv('MONITOR_DETECTION_FLUSH_SECONDS', '2'))
+# Rows that fail to write are kept for retry, up to this many batches
+DETECTION_MAX_PENDING_BATCHES = 20
+
+# Browser is recycled between checks once the Chrome process tree's RSS exceeds this (0 disables)
+MEMORY_CEILING_MB = float(os.getenv('MONITOR_MEMORY_CEILING_MB', '2048'))
+MEMORY_SAMPLE_INTERVAL = float(os.getenv('MONITOR_MEMORY_SAMPLE_SECONDS', '30'))
 
 # ACCOUNTS_TO_MONITOR = [
 #             "v_mello_",
@@ -87,6 +172,463 @@ class TwitterAccount:
         self.consecutive_failures = 0
         self.cooldown_until = 0
 
+async def connect_nats():
+    """Open a NATS connection to the local server; nats is imported on first use."""
+    import nats
+    return await nats.connect(NATS_URL, token=NATS_TOKEN)
+
+def load_selenium():
+    """Import Selenium into the module namespace the first time a browser is needed."""
+    global webdriver, By, Keys, WebDriverWait, Options, Service, EC
+    global StaleElementReferenceException, TimeoutException
+    if webdriver is not None:
+        return
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.chrome.options import Options
+    from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.chrome.service import Service
+
+@lru_cache(maxsize=None)
+def resolve_chromedriver():
+    """
+    Find the ChromeDriver binary for this host. Resolved once per process.
+    
+    Checks CHROMEDRIVER_PATH, then drivers/<platform>/chromedriver, then PATH.
+    
+    Returns:
+        str: Path to chromedriver, or None to let Selenium Manager fetch one
+        
+    Raises:
+        Exception: If CHROMEDRIVER_PATH is set but the file doesn't exist
+    """
+    override = os.getenv('CHROMEDRIVER_PATH')
+    if override and not os.path.exists(override):
+        raise Exception(f"ChromeDriver not found at {override}")
+
+    candidates = [override]
+    machine = platform.machine().lower()
+    system = 'linux' if sys.platform.startswith('linux') else sys.platform
+    platform_dir = DRIVER_PLATFORMS.get((system, machine))
+    if platform_dir:
+        binary = "chromedriver.exe" if system == 'win32' else "chromedriver"
+        candidates.append(os.path.join(DRIVERS_DIR, platform_dir, binary))
+    candidates.append(shutil.which("chromedriver"))
+
+    for path in candidates:
+        if path and os.path.exists(path):
+            # Make sure ChromeDriver is executable
+            if not os.access(path, os.X_OK):
+                os.chmod(path, 0o755)
+            print(f"Using ChromeDriver at {path}")
+            return path
+
+    print(f"No local ChromeDriver for {system}/{machine}, using Selenium Manager")
+    return None
+
+def process_started_at():
+    """Wall-clock time the process started, falling back to module import time."""
+    if psutil is not None:
+        try:
+            return psutil.Process().create_time()
+        except psutil.Error:
+            pass
+    return MODULE_LOADED_AT
+
+def parse_tweet_time(timestamp):
+    """
+    Parse the ISO 8601 datetime attribute of a tweet's <time> element.
+    
+    Returns:
+        datetime: Timezone-aware tweet time, or None if it can't be parsed
+    """
+    try:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+
+class DriverHangError(Exception):
+    """Raised when a driver operation overran its deadline and the browser was killed."""
+
+class ProfilingManager:
+    """
+    Opt-in profilers for the monitor process. Nothing is started unless the
+    profiler is named in MONITOR_PROFILERS, so the default run pays no overhead.
+    
+    Snapshots are written on demand (SIGUSR1 or a NATS request) to PROFILE_DIR.
+    
+    Attributes:
+        profilers (set): Names of the enabled profilers ('tracemalloc', 'cprofile')
+        profile_dir (str): Directory snapshot files are written to
+        profiler: cProfile.Profile instance, or None if cProfile is disabled
+    """
+    def __init__(self, profilers=MONITOR_PROFILERS, profile_dir=PROFILE_DIR):
+        self.profilers = set(profilers)
+        self.profile_dir = profile_dir
+        self.profiler = None
+        self.lock = threading.Lock()
+
+        if 'tracemalloc' in self.profilers:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                print("tracemalloc enabled")
+        if 'cprofile' in self.profilers:
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+            print("cProfile enabled")
+
+    @property
+    def enabled(self):
+        return bool(self.profilers)
+
+    def install_signal_handler(self):
+        """Dump a snapshot whenever the process receives SIGUSR1."""
+        if not self.enabled or not hasattr(signal, 'SIGUSR1'):
+            return
+        # The handler runs on the scrape thread, so hand the dump off to a worker
+        signal.signal(signal.SIGUSR1, lambda signum, frame: threading.Thread(
+            target=self.dump_snapshot, daemon=True).start())
+        print(f"Send SIGUSR1 to pid {os.getpid()} to dump a profiling snapshot")
+
+    def dump_snapshot(self):
+        """
+        Write the current state of every enabled profiler to disk. Skipped if
+        another dump is still in progress.
+        
+        Returns:
+            list: Paths of the files written
+        """
+        if not self.lock.acquire(blocking=False):
+            print("Profiling snapshot already in progress, skipping")
+            return []
+        paths = []
+        try:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+
+            if 'tracemalloc' in self.profilers:
+                import tracemalloc
+                snapshot = tracemalloc.take_snapshot()
+                path = os.path.join(self.profile_dir, f"tracemalloc-{stamp}.snap")
+                snapshot.dump(path)
+                paths.append(path)
+                print("Top allocations:")
+                for stat in snapshot.statistics('lineno')[:10]:
+                    print(f"  {stat}")
+
+            if self.profiler:
+                # dump_stats() would disable the profiler, and it can't be re-enabled
+                # from a NATS executor thread, so snapshot the stats in place instead
+                path = os.path.join(self.profile_dir, f"cprofile-{stamp}.prof")
+                self.profiler.snapshot_stats()
+                with open(path, 'wb') as f:
+                    marshal.dump(self.profiler.stats, f)
+                paths.append(path)
+        finally:
+            self.lock.release()
+
+        print(f"Profiling snapshot written: {paths}")
+        return paths
+
+class MemoryWatchdog:
+    """
+    Samples the RSS of this process and of the chromedriver/Chrome process tree
+    on a background thread, and flags the browser for recycling once the browser
+    tree crosses the configured ceiling. Python's own RSS is reported but not
+    counted, since restarting the browser can't release it. The monitor loop
+    does the actual restart between checks so a scrape is never interrupted
+    mid-page.
+    
+    Attributes:
+        monitor (TwitterMonitor): Monitor whose browser is being watched
+        ceiling_mb (float): Browser RSS limit in MB (0 disables the watchdog)
+        interval (float): Seconds between samples
+        last_sample (dict): Most recent RSS readings in MB
+        recycle_requested (threading.Event): Set when the ceiling was reached
+    """
+    def __init__(self, monitor, ceiling_mb=MEMORY_CEILING_MB, interval=MEMORY_SAMPLE_INTERVAL):
+        self.monitor = monitor
+        self.ceiling_mb = ceiling_mb
+        self.interval = interval
+        self.last_sample = {'python_mb': 0.0, 'browser_mb': 0.0}
+        self.recycle_requested = threading.Event()
+        self.thread = None
+
+    def start(self):
+        if self.ceiling_mb <= 0:
+            return
+        if psutil is None:
+            print("psutil not installed, memory watchdog disabled")
+            return
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        print(f"Memory watchdog started (ceiling {self.ceiling_mb:.0f} MB)")
+
+    def _browser_processes(self):
+        service = getattr(self.monitor, 'service', None)
+        process = getattr(service, 'process', None) if service else None
+        if process is None:
+            return []
+        try:
+            root = psutil.Process(process.pid)
+            return [root] + root.children(recursive=True)
+        except psutil.Error:
+            return []
+
+    def sample(self):
+        """
+        Measure current memory usage.
+        
+        Returns:
+            dict: python_mb and browser_mb RSS totals
+        """
+        python_mb = psutil.Process().memory_info().rss / (1024 * 1024)
+        browser_mb = 0.0
+        for proc in self._browser_processes():
+            try:
+                browser_mb += proc.memory_info().rss / (1024 * 1024)
+            except psutil.Error:
+                continue
+        self.last_sample = {'python_mb': python_mb, 'browser_mb': browser_mb}
+        return self.last_sample
+
+    def _run(self):
+        while True:
+            try:
+                sample = self.sample()
+                if sample['browser_mb'] >= self.ceiling_mb and not self.recycle_requested.is_set():
+                    print(f"Memory ceiling reached: python {sample['python_mb']:.0f} MB, "
+                          f"browser {sample['browser_mb']:.0f} MB")
+                    self.recycle_requested.set()
+            except Exception as e:
+                print(f"Error in memory watchdog: {e}")
+            time.sleep(self.interval)
+
+class DriverSupervisor:
+    """
+    Enforces deadlines on Selenium operations from a supervisor thread.
+    
+    The monitor thread marks each driver operation with deadline(). If the
+    operation is still running when its deadline passes, the supervisor kills
+    the chromedriver/Chrome process tree, which unblocks the stuck call, and
+    deadline() re-raises the failure as DriverHangError so the caller can
+    respawn the browser and retry.
+    
+    Attributes:
+        monitor (TwitterMonitor): Monitor whose browser is being supervised
+        poll_interval (float): Seconds between deadline checks
+        active (tuple): (operation, started, deadline) of the running operation, or None
+        stall_count (int): Number of operations that overran their deadline
+        stall_seconds (float): Total time lost to stalled operations
+    """
+    def __init__(self, monitor, poll_interval=0.5):
+        self.monitor = monitor
+        self.poll_interval = poll_interval
+        self.lock = threading.Lock()
+        self.active = None
+        self.killed = False
+        self.stall_count = 0
+        self.stall_seconds = 0.0
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    @contextmanager
+    def deadline(self, operation, seconds=DRIVER_DEADLINE):
+        """
+        Run the enclosed driver operation under a deadline.
+        
+        Args:
+            operation (str): Name used in stall reports
+            seconds (float): Time allowed before the browser is killed
+            
+        Raises:
+            DriverHangError: If the supervisor killed the browser during the operation
+        """
+        started = time.monotonic()
+        with self.lock:
+            self.active = (operation, started, started + seconds)
+            self.killed = False
+        try:
+            yield
+        except Exception as e:
+            if self.killed:
+                raise DriverHangError(f"{operation} exceeded {seconds:.0f}s deadline") from e
+            raise
+        finally:
+            with self.lock:
+                self.active = None
+            if self.killed:
+                self.record_stall(operation, time.monotonic() - started)
+        if self.killed:
+            raise DriverHangError(f"{operation} exceeded {seconds:.0f}s deadline")
+
+    def record_stall(self, operation, seconds):
+        """
+        Count a stalled driver operation towards the stall totals.
+        
+        Args:
+            operation (str): Name of the operation that stalled
+            seconds (float): Time lost to the stall
+        """
+        with self.lock:
+            self.stall_count += 1
+            self.stall_seconds += seconds
+            print(f"Driver stall in {operation}: {seconds:.1f}s "
+                  f"({self.stall_count} stalls, {self.stall_seconds:.0f}s total)")
+
+    def kill_browser(self):
+        """Kill chromedriver and every Chrome process it spawned."""
+        service = getattr(self.monitor, 'service', None)
+        process = getattr(service, 'process', None) if service else None
+        if process is None:
+            return
+        if psutil is not None:
+            try:
+                root = psutil.Process(process.pid)
+                for proc in root.children(recursive=True) + [root]:
+                    try:
+                        proc.kill()
+                    except psutil.Error:
+                        continue
+                return
+            except psutil.Error:
+                pass
+        try:
+            process.kill()
+        except Exception as e:
+            print(f"Error killing chromedriver: {e}")
+
+    def _run(self):
+        while True:
+            with self.lock:
+                active = self.active
+                expired = active is not None and not self.killed and time.monotonic() > active[2]
+                if expired:
+                    self.killed = True
+            if expired:
+                print(f"Driver operation {active[0]} hung, killing browser...")
+                self.kill_browser()
+            time.sleep(self.poll_interval)
+
+class DetectionWriter:
+    """
+    Writes snipe detections to the detections table from a background thread.
+    
+    Rows are queued by the monitor thread and inserted with executemany in a
+    single transaction once DETECTION_BATCH_SIZE rows are pending or
+    DETECTION_FLUSH_INTERVAL seconds have passed, so the scrape loop never
+    waits on SQLite. Successful broadcasts also set sniped/mint on the user.
+    
+    Attributes:
+        db_path (str): Path to sniper.db
+        failed (bool): True if the database couldn't be opened; rows are then dropped
+        batch_size (int): Rows per insert batch
+        flush_interval (float): Maximum seconds a row waits before being written
+        queue (queue.Queue): Pending detection rows
+        written (int): Number of rows written so far
+    """
+    COLUMNS = ('tweet_id', 'username', 'address', 'tweet_time', 'detected_at',
+               'broadcast_at', 'broadcast_result', 'account')
+
+    def __init__(self, db_path=DB_PATH, batch_size=DETECTION_BATCH_SIZE, flush_interval=DETECTION_FLUSH_INTERVAL):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue()
+        self.written = 0
+        self.failed = False
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        try:
+            init_detections_db(self.db_path)
+        except sqlite3.Error as e:
+            print(f"Error creating detections table, detections won't be recorded: {e}")
+            self.failed = True
+            return
+        self.thread.start()
+
+    def record(self, **detection):
+        """Queue a detection row; keys are the names in COLUMNS."""
+        if self.failed:
+            return
+        self.queue.put(tuple(detection.get(column) for column in self.COLUMNS))
+
+    def close(self):
+        """Flush any pending rows and stop the writer thread."""
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join(timeout=10)
+
+    def _flush(self, conn, rows):
+        """
+        Insert a batch, retrying once (e.g. if inject_user holds the write lock).
+        
+        Returns:
+            bool: True if the rows were written
+        """
+        placeholders = ', '.join('?' for _ in self.COLUMNS)
+        sniped = [(row[2], row[1]) for row in rows if row[6] == 'success']
+        for attempt in range(2):
+            try:
+                with conn:
+                    conn.executemany(
+                        f"INSERT INTO detections ({', '.join(self.COLUMNS)}) VALUES ({placeholders})", rows)
+                    conn.executemany("UPDATE users SET sniped = 1, mint = ? WHERE username = ?", sniped)
+                self.written += len(rows)
+                return True
+            except sqlite3.Error as e:
+                print(f"Error writing {len(rows)} detections (attempt {attempt + 1}): {e}")
+                if attempt == 0:
+                    time.sleep(0.5)
+        return False
+
+    def _run(self):
+        try:
+            conn = sqlite3.connect(self.db_path)
+        except sqlite3.Error as e:
+            print(f"Error opening {self.db_path}, detections won't be recorded: {e}")
+            self.failed = True
+            return
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.Error as e:
+            # Only a concurrency optimisation; a locked database shouldn't stop the writer
+            print(f"Could not enable WAL for detections: {e}")
+        rows = []
+        deadline = None
+        retrying = False
+        stopping = False
+        while not stopping:
+            timeout = None if deadline is None else max(0, deadline - time.monotonic())
+            try:
+                row = self.queue.get(timeout=timeout)
+                if row is None:
+                    stopping = True
+                else:
+                    rows.append(row)
+                    deadline = deadline or time.monotonic() + self.flush_interval
+            except queue.Empty:
+                pass
+            full = len(rows) >= self.batch_size and not retrying
+            if rows and (stopping or full or time.monotonic() >= deadline):
+                if self._flush(conn, rows):
+                    rows = []
+                elif stopping or len(rows) >= self.batch_size * DETECTION_MAX_PENDING_BATCHES:
+                    print(f"Dropping {len(rows)} detections after repeated write failures")
+                    rows = []
+                # Failed rows stay pending and are retried after the next interval
+                retrying = bool(rows)
+                deadline = time.monotonic() + self.flush_interval if rows else None
+        conn.close()
+
 class TwitterMonitor:
     """
     Main monitoring system for Twitter accounts. Manages browser automation,
@@ -100,13 +642,25 @@ class TwitterMonitor:
         keywords (list): List of keywords to monitor
         latest_tweets (dict): Cache of most recent tweet IDs per user
         processed_addresses (set): Set of already processed contract addresses
+        overlay_counts (dict): Number of times each overlay selector was closed
+        consecutive_login_hangs (int): Logins in a row that ended in a browser hang
     """
     def __init__(self, proxy=None):
         """
         Initialize the Twitter monitoring system.
         """
         print("Starting TwitterMonitor initialization...")
+        self.startup_marks = {'module_loaded': MODULE_LOADED_AT}
+        self.proxy = proxy
+        self.profiling = ProfilingManager()
+        self.profiling.install_signal_handler()
+        self.supervisor = DriverSupervisor(self)
+        self.supervisor.start()
+        self.consecutive_login_hangs = 0
+        self.detections = DetectionWriter()
+        self.detections.start()
         self.setup_browser(proxy)
+        self.mark_startup('browser_ready')
         self.accounts = []
         self.current_account_index = 0
         self.initialize_accounts()
@@ -115,17 +669,39 @@ class TwitterMonitor:
         self.latest_tweets = {}
         self.snipe_list_path = "pending-snipe-list.txt"
         self.processed_addresses = set()
+        self.overlay_counts = {}
         self.load_processed_addresses()
         self.loop = asyncio.new_event_loop()
         self.loop_thread = threading.Thread(target=self.loop.run_forever, daemon=True)
         self.loop_thread.start()
+        self.event_nc = None
+        self.event_js = None
+        self.event_lock = asyncio.Lock()
+        if self.profiling.enabled:
+            asyncio.run_coroutine_threadsafe(self.listen_for_snapshot_requests(), self.loop)
+        self.memory_watchdog = MemoryWatchdog(self)
+        self.memory_watchdog.start()
         print("TwitterMonitor initialization complete")
 
+    async def listen_for_snapshot_requests(self):
+        """Reply to requests on PROFILE_SNAPSHOT_SUBJECT with a fresh profiling snapshot"""
+        async def handler(msg):
+            paths = await self.loop.run_in_executor(None, self.profiling.dump_snapshot)
+            reply = {"paths": paths, "memory": self.memory_watchdog.last_sample}
+            await msg.respond(json.dumps(reply).encode())
+
+        try:
+            self.control_nc = await connect_nats()
+            await self.control_nc.subscribe(PROFILE_SNAPSHOT_SUBJECT, cb=handler)
+            print(f"Listening for profiling requests on {PROFILE_SNAPSHOT_SUBJECT}")
+        except Exception as e:
+            print(f"Error starting profiling listener: {e}")
+
     async def broadcast_message(self, amount, address):
         """Internal method for broadcasting"""
         try:
             print("attempting broadcast...")
-            nc = await nats.connect("nats://127.0.0.1:4222", token="QAkF884gXdP9dXk")
+            nc = await connect_nats()
             
             # Create a message object with all necessary data
             message = {
@@ -145,8 +721,53 @@ class TwitterMonitor:
             print(f"Error in broadcast_message: {e}")
             raise
 
+    async def get_event_connection(self):
+        """
+        Return the shared connection used for tweet events, connecting on first use.
+        
+        Returns:
+            JetStream context if MONITOR_TWEET_STREAM is set, otherwise the NATS client
+        """
+        async with self.event_lock:
+            if self.event_nc is None or self.event_nc.is_closed:
+                self.event_nc = await connect_nats()
+                self.event_js = None
+                if TWEET_STREAM:
+                    self.event_js = self.event_nc.jetstream()
+                    await self.event_js.add_stream(
+                        name=TWEET_STREAM,
+                        subjects=[f"{TWEET_SUBJECT_PREFIX}.>"],
+                        max_age=TWEET_STREAM_MAX_AGE,
+                        duplicate_window=TWEET_STREAM_DUPLICATE_WINDOW,
+                    )
+                    print(f"Tweet events retained in JetStream stream {TWEET_STREAM}")
+            return self.event_js or self.event_nc
+
+    async def publish_tweet_event(self, event):
+        """Internal method for publishing a tweet event"""
+        publisher = await self.get_event_connection()
+        subject = f"{TWEET_SUBJECT_PREFIX}.{event['username']}"
+        # latest_tweets is in-memory only, so a restart sees the same tweets again;
+        # the message ID lets JetStream deduplicate them
+        headers = {'Nats-Msg-Id': f"{event['username']}:{event['id']}"}
+        await publisher.publish(subject, json.dumps(event).encode(), headers=headers)
+
+    def publish_tweet(self, event):
+        """
+        Publish a parsed tweet without blocking the scrape loop.
+        
+        Args:
+            event (dict): Tweet event with text, id, author, timestamp, addresses and latency
+        """
+        def report(future):
+            if future.exception():
+                print(f"Error publishing tweet {event['id']}: {future.exception()}")
+
+        future = asyncio.run_coroutine_threadsafe(self.publish_tweet_event(event), self.loop)
+        future.add_done_callback(report)
+
     def process_contract(self, amount, address):
-        """Synchronous wrapper for broadcasting"""
+        """Synchronous wrapper for broadcasting; returns 'success' or 'error: <detail>'"""
         try:
             print("Attempting to process contract...")
             future = asyncio.run_coroutine_threadsafe(
@@ -155,12 +776,15 @@ class TwitterMonitor:
             )
             future.result(timeout=10)  # Wait up to 10 seconds for the broadcast
             print(f"Successfully processed contract: {address}")
+            return 'success'
         except Exception as e:
             print(f"Error in process_contract: {e}")
+            return f"error: {e!r}"
 
     def setup_browser(self, proxy=None):
         try:
             print("Configuring Chrome options...")
+            load_selenium()
             self.options = Options()
 
             # Anti-bot detection settings
@@ -183,23 +807,20 @@ class TwitterMonitor:
             selected_agent = random.choice(user_agents)
             self.options.add_argument(f'user-agent={selected_agent}')
 
-            # Use local ChromeDriver
-            driver_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "drivers", "mac-arm64", "chromedriver")
-            
-            # Make sure ChromeDriver is executable
-            if not os.path.exists(driver_path):
-                raise Exception(f"ChromeDriver not found at {driver_path}")
-            os.chmod(driver_path, 0o755)
+            driver_path = resolve_chromedriver()
 
             # Add proxy if provided
             if proxy:
                 self.options.add_argument(f'--proxy-server={proxy}')
 
+            # self.service is set first so the supervisor can kill a hung session start
             self.service = Service(driver_path)
-            self.driver = webdriver.Chrome(service=self.service, options=self.options)
-            self.wait = WebDriverWait(self.driver, 10)
-            self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": selected_agent})
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            with self.supervisor.deadline('setup_browser', SETUP_DEADLINE):
+                self.driver = webdriver.Chrome(service=self.service, options=self.options)
+                self.driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+                self.wait = WebDriverWait(self.driver, 10)
+                self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": selected_agent})
+                self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
 
             print("Browser setup completed successfully")
             
@@ -209,6 +830,17 @@ class TwitterMonitor:
             traceback.print_exc()
             raise
 
+    def mark_startup(self, milestone):
+        """Record the first time a cold-start milestone is reached."""
+        self.startup_marks.setdefault(milestone, time.time())
+
+    def report_startup(self):
+        """Print each cold-start milestone relative to process start."""
+        started = process_started_at()
+        print("Startup timings (seconds since process start):")
+        for milestone, reached in sorted(self.startup_marks.items(), key=lambda item: item[1]):
+            print(f"  {milestone:<15} {reached - started:7.2f}")
+
     def initialize_accounts(self):
         """
         Load Twitter account credentials from environment variables.
@@ -285,12 +917,82 @@ class TwitterMonitor:
         Safely restart the browser instance with random delay.
         """
         try:
-            self.driver.quit()
+            with self.supervisor.deadline('quit'):
+                self.driver.quit()
         except:
             pass
         finally:
             time.sleep(random.uniform(3, 6))
-            self.setup_browser()
+            self.setup_browser(self.proxy)
+
+    def recycle_browser_if_needed(self, account):
+        """
+        Restart the browser and log back in if the memory watchdog hit its ceiling.
+        
+        Args:
+            account (TwitterAccount): Account to log back in with
+            
+        Returns:
+            bool: False if the browser was recycled but the login failed
+        """
+        if not self.memory_watchdog.recycle_requested.is_set():
+            return True
+
+        print("Recycling browser to release memory...")
+        self.memory_watchdog.recycle_requested.clear()
+        return self.relaunch_browser(account)
+
+    def relaunch_browser(self, account):
+        """
+        Restart the browser and log back in with the current account.
+        
+        Args:
+            account (TwitterAccount): Account to log back in with
+            
+        Returns:
+            bool: True if the new browser is logged in
+        """
+        try:
+            self.restart_browser()
+        except DriverHangError as e:
+            print(f"✗ Browser hung while restarting: {e}")
+            self.handle_login_hang(account)
+            self.logged_in_account = None
+            return False
+        if not self.login(account):
+            self.logged_in_account = None
+            return False
+        return True
+
+    def handle_login_hang(self, account):
+        """
+        Back off when the browser keeps hanging before a login completes.
+        
+        A single hang is blamed on the browser, but repeated ones usually mean the
+        network or proxy is down, so the account is put in cooldown like a failed
+        login and the loop eventually falls back to the all-accounts wait.
+        
+        Args:
+            account (TwitterAccount): Account whose login hung
+        """
+        self.consecutive_login_hangs += 1
+        if self.consecutive_login_hangs >= LOGIN_HANG_LIMIT:
+            print(f"{self.consecutive_login_hangs} login hangs in a row, backing off")
+            self.handle_account_failure(account)
+
+    def load_page(self, url):
+        """
+        Navigate to a URL, treating a page-load timeout as a hung browser.
+        
+        Raises:
+            DriverHangError: If the page didn't load within PAGE_LOAD_TIMEOUT
+        """
+        started = time.monotonic()
+        try:
+            self.driver.get(url)
+        except TimeoutException as e:
+            self.supervisor.record_stall('driver.get', time.monotonic() - started)
+            raise DriverHangError(f"page load of {url} exceeded {PAGE_LOAD_TIMEOUT:.0f}s") from e
 
     def _type_like_human(self, element, text):
         """
@@ -321,153 +1023,177 @@ class TwitterMonitor:
             - Login verification
         """
         try:
-            print(f"\nAttempting to login with account: {account.username}")
+            with self.supervisor.deadline('login', LOGIN_DEADLINE):
+                print(f"\nAttempting to login with account: {account.username}")
             
-            self.driver.get("https://twitter.com/i/flow/login")
-            time.sleep(random.uniform(4, 7))
+                self.load_page("https://twitter.com/i/flow/login")
+                time.sleep(random.uniform(4, 7))
             
-            # Enter email
-            email_input = self.wait.until(EC.presence_of_element_located(
-                (By.XPATH, "//input[@autocomplete='username']")))
-            self._type_like_human(email_input, account.email)
-            email_input.send_keys(Keys.RETURN)
-            time.sleep(random.uniform(3, 5))
+                # Enter email
+                email_input = self.wait.until(EC.presence_of_element_located(
+                    (By.XPATH, "//input[@autocomplete='username']")))
+                self._type_like_human(email_input, account.email)
+                email_input.send_keys(Keys.RETURN)
+                time.sleep(random.uniform(3, 5))
             
-            # Check for unusual activity prompt and handle username verification
-            try:
-                username_input = self.wait.until(EC.presence_of_element_located(
-                    (By.XPATH, "//input[@data-testid='ocfEnterTextTextInput']")))
-                if username_input:
-                    print("Unusual activity detected, entering username...")
-                    self._type_like_human(username_input, account.username)
-                    username_input.send_keys(Keys.RETURN)
-                    time.sleep(random.uniform(3, 5))
-            except TimeoutException:
-                # No unusual activity detected, continue with normal login
-                pass
+                # Check for unusual activity prompt and handle username verification
+                try:
+                    username_input = self.wait.until(EC.presence_of_element_located(
+                        (By.XPATH, "//input[@data-testid='ocfEnterTextTextInput']")))
+                    if username_input:
+                        print("Unusual activity detected, entering username...")
+                        self._type_like_human(username_input, account.username)
+                        username_input.send_keys(Keys.RETURN)
+                        time.sleep(random.uniform(3, 5))
+                except TimeoutException:
+                    # No unusual activity detected, continue with normal login
+                    pass
                 
-            # Enter password
-            password_input = self.wait.until(EC.presence_of_element_located(
-                (By.XPATH, "//input[@name='password']")))
-            self._type_like_human(password_input, account.password)
-            password_input.send_keys(Keys.RETURN)
-            time.sleep(random.uniform(4, 7))
+                # Enter password
+                password_input = self.wait.until(EC.presence_of_element_located(
+                    (By.XPATH, "//input[@name='password']")))
+                self._type_like_human(password_input, account.password)
+                password_input.send_keys(Keys.RETURN)
+                time.sleep(random.uniform(4, 7))
             
-            # Verify login success
-            try:
-                self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="tweet"]')))
-                print(f"✓ Successfully logged in with {account.username}")
-                self.handle_account_success(account)
-                return True
-            except TimeoutException:
-                print(f"✗ Login verification failed for {account.username}")
-                self.handle_account_failure(account)
-                return False
+                # Verify login success
+                try:
+                    self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="tweet"]')))
+                    print(f"✓ Successfully logged in with {account.username}")
+                    self.consecutive_login_hangs = 0
+                    self.handle_account_success(account)
+                    return True
+                except TimeoutException:
+                    print(f"✗ Login verification failed for {account.username}")
+                    self.handle_account_failure(account)
+                    return False
             
+        except DriverHangError as e:
+            print(f"✗ Browser hung during login for {account.username}: {e}")
+            self.handle_login_hang(account)
+            return False
         except Exception as e:
             print(f"✗ Login failed for {account.username}: {e}")
             self.handle_account_failure(account)
             return False
 
     def handle_potential_redirects(self):
-        """Handle any Twitter redirects or overlays that might appear"""
+        """
+        Close any known Twitter overlay in a single script round trip.
+        
+        Returns:
+            list: Selectors that matched and were clicked
+        """
         try:
-            # Try to find and close any login prompts
-            overlay_selectors = [
-                '[data-testid="close"]',  # Generic close button
-                '[data-testid="confirmationSheetClose"]',  # Confirmation sheet close
-                '[data-testid="LoginModal_Close_Button"]',  # Login modal close
-                'div[aria-label="Close"]'  # Generic close by aria-label
-            ]
-            
-            for selector in overlay_selectors:
-                try:
-                    close_button = WebDriverWait(self.driver, 3).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    close_button.click()
-                    print(f"Closed overlay with selector: {selector}")
-                    time.sleep(1)  # Short wait after closing
-                except:
-                    continue
-                    
+            closed = self.driver.execute_script(DISMISS_OVERLAYS_SCRIPT, OVERLAY_SELECTORS) or []
+            for selector in closed:
+                self.overlay_counts[selector] = self.overlay_counts.get(selector, 0) + 1
+                print(f"Closed overlay with selector: {selector} ({self.overlay_counts[selector]} total)")
+            return closed
         except Exception as e:
             print(f"Error handling redirects: {e}")
             # Continue execution even if handling fails
+            return []
 
     def check_user_tweets(self, username, account, amount):
+        if 'first_check' not in self.startup_marks:
+            self.mark_startup('first_check')
+            self.report_startup()
         try:
             print(f"Checking tweets for {username}...")
-            self.driver.get(f"https://twitter.com/{username}")
+            with self.supervisor.deadline('driver.get'):
+                self.load_page(f"https://twitter.com/{username}")
             
             # Wait for page load
             time.sleep(random.uniform(4, 6))
+            with self.supervisor.deadline('handle_potential_redirects'):
+                self.handle_potential_redirects()
             
             # Navigate to Posts tab
-            try:
-                posts_tab = self.wait.until(EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, 'a[href$="/tweets"]')))
-                posts_tab.click()
-                time.sleep(random.uniform(1, 2))
-            except:
-                print(f"Could not find Posts tab for {username}, continuing with current view")
+            with self.supervisor.deadline('posts_tab'):
+                try:
+                    posts_tab = self.wait.until(EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, 'a[href$="/tweets"]')))
+                    posts_tab.click()
+                    time.sleep(random.uniform(1, 2))
+                except:
+                    print(f"Could not find Posts tab for {username}, continuing with current view")
             
             for _ in range(2):
                 scroll_amount = random.randint(300, 700)
-                self.driver.execute_script(f"window.scrollBy(0, {scroll_amount})")
+                with self.supervisor.deadline('scroll'):
+                    self.driver.execute_script(f"window.scrollBy(0, {scroll_amount})")
                 time.sleep(random.uniform(1, 2))
             
-            tweet_elements = self.wait.until(EC.presence_of_all_elements_located(
-                (By.CSS_SELECTOR, 'article[data-testid="tweet"]')))
+            with self.supervisor.deadline('wait_for_tweets'):
+                tweet_elements = self.wait.until(EC.presence_of_all_elements_located(
+                    (By.CSS_SELECTOR, 'article[data-testid="tweet"]')))
             
             self.handle_account_success(account)
             
             new_tweets = []
             for tweet in tweet_elements[:5]:
                 try:
-                    # # First and most important check: Look for socialContext which indicates a repost
-                    # try:
-                    #     social_context = tweet.find_element(By.CSS_SELECTOR, 'span[data-testid="socialContext"]')
-                    #     print("Skipping - Found repost indicator")
-                    #     continue
-                    # except:
-                    #     # No socialContext found - this is good, might be an original tweet
-                    #     pass
-
-                    # Get the tweet text
-                    try:
-                        tweet_text = tweet.find_element(By.CSS_SELECTOR, '[data-testid="tweetText"]').text.strip()
-                    except:
-                        print("Couldn't find tweet text, skipping")
-                        continue
-                        
+                    # Only the Selenium lookups run under the deadline; broadcasting can
+                    # legitimately block on NATS and must not be mistaken for a hang
+                    with self.supervisor.deadline('parse_tweet'):
+                        # # First and most important check: Look for socialContext which indicates a repost
+                        # try:
+                        #     social_context = tweet.find_element(By.CSS_SELECTOR, 'span[data-testid="socialContext"]')
+                        #     print("Skipping - Found repost indicator")
+                        #     continue
+                        # except:
+                        #     # No socialContext found - this is good, might be an original tweet
+                        #     pass
+
+                        # Get the tweet text
+                        try:
+                            tweet_text = tweet.find_element(By.CSS_SELECTOR, '[data-testid="tweetText"]').text.strip()
+                        except:
+                            print("Couldn't find tweet text, skipping")
+                            continue
+
+                        try:
+                            tweet_link = tweet.find_element(By.CSS_SELECTOR, 'a[href*="/status/"]').get_attribute('href')
+                        except:
+                            tweet_link = None  # Still broadcast and audit; just can't dedupe or publish
+                        try:
+                            timestamp = tweet.find_element(By.TAG_NAME, 'time').get_attribute('datetime')
+                        except:
+                            timestamp = None
+                    
+                    detected_at = time.time()
+                    tweet_id = tweet_link.split('/')[-1] if tweet_link else None
                     print(f"Processing original tweet: {tweet_text}")
                     
                     # Process addresses for original tweets only
                     matches = re.findall(self.address_pattern, tweet_text)
                     
+                    is_new = tweet_id is not None and (
+                        username not in self.latest_tweets or tweet_id > self.latest_tweets[username])
+                    if is_new:
+                        self.latest_tweets[username] = tweet_id
+                        # Publish before broadcasting, which can block for seconds per address
+                        self.publish_tweet(self.build_tweet_event(
+                            username, tweet_id, tweet_link, tweet_text, timestamp, matches, detected_at))
+                    
+                    broadcasts = []
                     if matches:
                         print(f"Found addresses in original tweet: {matches}")
                         for address in matches:
                             if address not in self.processed_addresses:
                                 print(f"Broadcasting: {address}")
-                                try:
-                                    self.process_contract(amount, address)
-                                    self.processed_addresses.add(address)
-                                except Exception as e:
-                                    print(f"Failed to process contract {address}: {e}")
+                                result = self.process_contract(amount, address)
+                                self.processed_addresses.add(address)
+                                broadcasts.append((address, detected_at, time.time(), result))
                     
-                    tweet_link = tweet.find_element(By.CSS_SELECTOR, 'a[href*="/status/"]').get_attribute('href')
-                    tweet_id = tweet_link.split('/')[-1]
+                    if broadcasts:
+                        self.record_detections(tweet_id, username, account, timestamp, broadcasts)
                     
-                    if username in self.latest_tweets and tweet_id <= self.latest_tweets[username]:
+                    if not is_new:
                         continue
                     
-                    self.latest_tweets[username] = max(tweet_id, self.latest_tweets.get(username, '0'))
-                    
                     if matches or any(keyword.lower() in tweet_text.lower() for keyword in self.keywords):
-                        timestamp = tweet.find_element(By.TAG_NAME, 'time').get_attribute('datetime')
-                        
                         new_tweets.append({
                             'username': username,
                             'text': tweet_text,
@@ -477,6 +1203,8 @@ class TwitterMonitor:
                         })
                         print(f"Added new original tweet with addresses: {matches}")
                         
+                except DriverHangError:
+                    raise
                 except StaleElementReferenceException:
                     continue
                 except Exception as e:
@@ -485,11 +1213,72 @@ class TwitterMonitor:
             
             return new_tweets
             
+        except DriverHangError:
+            raise
         except Exception as e:
             print(f"Error checking tweets for {username}: {e}")
             self.handle_account_failure(account)
             return []
 
+    def record_detections(self, tweet_id, username, account, timestamp, broadcasts):
+        """
+        Queue one detections row per address broadcast from a tweet.
+        
+        Args:
+            tweet_id (str): Tweet status ID, or None if the link wasn't found
+            username (str): Monitored account the tweet was found on
+            account (TwitterAccount): Account used for the check
+            timestamp (str): ISO 8601 tweet time, or None if it wasn't found
+            broadcasts (list): (address, detected_at, broadcast_at, result) tuples
+        """
+        tweet_time = parse_tweet_time(timestamp)
+        for address, detected_at, broadcast_at, result in broadcasts:
+            self.detections.record(
+                tweet_id=tweet_id,
+                username=username,
+                address=address,
+                tweet_time=tweet_time.timestamp() if tweet_time else None,
+                detected_at=detected_at,
+                broadcast_at=broadcast_at,
+                broadcast_result=result,
+                account=account.username,
+            )
+
+    def build_tweet_event(self, username, tweet_id, tweet_link, tweet_text, timestamp, addresses, detected_at):
+        """
+        Build the event published for a newly seen tweet.
+        
+        Args:
+            username (str): Monitored account the tweet was found on
+            tweet_id (str): Tweet status ID
+            tweet_link (str): Tweet URL, used to recover the original author
+            tweet_text (str): Tweet text
+            timestamp (str): ISO 8601 tweet time from the <time> element
+            addresses (list): Contract addresses found in the text
+            detected_at (float): Unix time the tweet was parsed
+            
+        Returns:
+            dict: JSON-serialisable tweet event
+        """
+        detected_at = datetime.fromtimestamp(detected_at, timezone.utc)
+        tweeted_at = parse_tweet_time(timestamp)
+        latency = (detected_at - tweeted_at).total_seconds() if tweeted_at else None
+
+        parts = tweet_link.split('/')
+        author = parts[-3] if len(parts) >= 3 and parts[-2] == 'status' else username
+
+        return {
+            'id': tweet_id,
+            'username': username,
+            'author': author,
+            'text': tweet_text,
+            'timestamp': timestamp,
+            'url': tweet_link,
+            'addresses': addresses,
+            'detected_at': detected_at.isoformat(),
+            'detection_latency': latency,
+        }
+
     def load_processed_addresses(self):
         """
         Load previously processed contract addresses from the snipe list file.
@@ -524,7 +1313,7 @@ class TwitterMonitor:
             - JSON-based tweet archiving
         """
 
-        conn = sqlite3.connect("../../database/sniper.db")
+        conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM users")  # Change 'users' to your actual table name
         users = cursor.fetchall()
@@ -540,19 +1329,38 @@ class TwitterMonitor:
                 
                 # Try to login if needed
                 if not hasattr(self, 'logged_in_account') or self.logged_in_account != current_account:
-                    self.restart_browser()
-                    if not self.login(current_account):
+                    if not self.relaunch_browser(current_account):
                         continue
                     self.logged_in_account = current_account
+                    self.mark_startup('logged_in')
 
-                for username in users  *  10:
+                pending = deque(users * 10)
+                retried = set()
+                while pending:
+                    username = pending.popleft()
                     amount = cursor.execute("SELECT amount FROM users WHERE username = ?", (username[0],)).fetchone()
                     # conn = sqlite3.connect("../../database/sniper.db")
                     # cursor = conn.cursor()
                     # cursor.execute("SELECT * FROM users")  # Change 'users' to your actual table name
                     # users = cursor.fetchall()
                     print("USERNAME IN USERNAMES: " + username[0])
-                    new_tweets = self.check_user_tweets(username[0], current_account, amount)
+                    try:
+                        new_tweets = self.check_user_tweets(username[0], current_account, amount)
+                    except DriverHangError as e:
+                        print(f"Browser hung checking {username[0]}: {e}. Respawning browser...")
+                        if username[0] not in retried:
+                            retried.add(username[0])
+                            pending.appendleft(username)  # Retry this user once on the new browser
+                        else:
+                            print(f"Dropping {username[0]} for the rest of this cycle after repeated hangs")
+                            pending = deque(user for user in pending if user[0] != username[0])
+                        if not self.relaunch_browser(current_account):
+                            break  # Will trigger a fresh login next cycle
+                        continue
+
+                    if STARTUP_BENCHMARK:
+                        conn.close()
+                        return
                     
                     if new_tweets is None:  # Indicates a major error
                         break  # Will trigger account switch
@@ -584,7 +1392,13 @@ class TwitterMonitor:
                             f.write(json.dumps(tweet_data) + '\n')
                     
                     time.sleep(random.uniform(5, 13))
+
+                    if not self.recycle_browser_if_needed(current_account):
+                        break  # Will trigger a fresh login next cycle
                 
+                if self.supervisor.stall_count:
+                    print(f"Driver stalls so far: {self.supervisor.stall_count} "
+                          f"({self.supervisor.stall_seconds:.0f}s total)")
                 cycle_interval = random.uniform(min_interval, max_interval)
                 print(f"\nWaiting {int(cycle_interval)} seconds before next cycle...")
                 time.sleep(cycle_interval)
@@ -600,7 +1414,7 @@ async def async_main():
     monitor = TwitterMonitor(proxy)
     
     try:
-        await monitor.monitor_accounts()
+        monitor.monitor_accounts()
     except KeyboardInterrupt:
         print("\nMonitoring stopped by user")
     except Exception as e:
@@ -608,10 +1422,19 @@ async def async_main():
         traceback.print_exc()
     finally:
         print("Cleanup in async_main")
+        if hasattr(monitor, 'detections'):
+            monitor.detections.close()
         if hasattr(monitor, 'driver'):
             monitor.driver.quit()
         if hasattr(monitor, 'loop'):
-            monitor.loop.stop()
+            if monitor.event_nc and not monitor.event_nc.is_closed:
+                try:
+                    asyncio.run_coroutine_threadsafe(monitor.event_nc.drain(), monitor.loop).result(timeout=5)
+                except Exception as e:
+                    print(f"Error draining tweet event connection: {e}")
+            # The loop runs in loop_thread, so stop it there before closing it
+            monitor.loop.call_soon_threadsafe(monitor.loop.stop)
+            monitor.loop_thread.join(timeout=5)
             monitor.loop.close()
 
 def main():